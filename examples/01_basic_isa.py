@@ -54,16 +54,17 @@ def main():
     # 4. Pressure ratio and density ratio calculations
     print("\n4. Standard Ratios (relative to sea level):")
     print("-" * 45)
-    test_altitudes = [5_000, 11_000, 15_000, 20_000]  # meters
+    test_altitudes = np.array([5_000, 11_000, 15_000, 20_000])  # meters
     
     print(f"{'Alt [m]':>8} {'δ (p/p₀)':>12} {'σ (ρ/ρ₀)':>12} {'θ (T/T₀)':>12}")
     print("-" * 45)
     
-    for alt in test_altitudes:
-        atm = isa_atmosphere(alt)
-        delta = atm.pressure / sea_level.pressure
-        sigma = atm.density / sea_level.density
-        theta = atm.temperature / sea_level.temperature
+    # One vectorized call for all altitudes; the loop below only formats the results
+    atm = isa_atmosphere(test_altitudes)
+    deltas = atm.pressure / sea_level.pressure
+    sigmas = atm.density / sea_level.density
+    thetas = atm.temperature / sea_level.temperature
+    for alt, delta, sigma, theta in zip(test_altitudes, deltas, sigmas, thetas):
         print(f"{alt:8.0f} {delta:12.6f} {sigma:12.6f} {theta:12.6f}")
 
 if __name__ == "__main__":
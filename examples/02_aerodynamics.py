@@ -19,70 +19,72 @@ def main():
     print("-" * 40)
     
     # Calculate different speed types
-    speeds_ms = [50, 100, 150, 200, 250]  # m/s
+    speeds_ms = np.array([50, 100, 150, 200, 250])  # m/s
     
     print(f"{'TAS [m/s]':>10} {'EAS [m/s]':>10} {'Mach':>8} {'Re (L=1m)':>12}")
     print("-" * 42)
 
     atm = isa_atmosphere(10_000)
 
-    for speed in speeds_ms:
-        aero = aerodynamic_state(speed, speed_type="TAS", atmosphere_state=atm, characteristic_length=1.0)
-        print(f"{speed:10.0f} {aero.EAS:10.1f} {aero.mach:8.4f} {aero.reynolds:12.2e}")
+    # One vectorized call for all speeds; the loop below only formats the results
+    aero = aerodynamic_state(speeds_ms, speed_type="TAS", atmosphere_state=atm, characteristic_length=1.0)
+    for speed, eas, mach, reynolds in zip(speeds_ms, aero.EAS, aero.mach, aero.reynolds):
+        print(f"{speed:10.0f} {eas:10.1f} {mach:8.4f} {reynolds:12.2e}")
     
     # 2. Altitude effects on aerodynamics
     print("\n2. Altitude Effects on Aerodynamics:")
     print("-" * 40)
     print("Fixed TAS = 150 m/s, varying altitude")
     
-    altitudes = [0, 5_000, 10_000, 15_000, 20_000]  # meters
+    altitudes = np.array([0, 5_000, 10_000, 15_000, 20_000])  # meters
     tas_fixed = 150  # m/s
     
     print(f"{'Alt [m]':>8} {'TAS [m/s]':>10} {'EAS [m/s]':>10} {'Mach':>8} {'q [Pa]':>10}")
     print("-" * 48)
     
-    for alt in altitudes:
-        atm = isa_atmosphere(alt)
-        aero = aerodynamic_state(tas_fixed, atmosphere_state=atm, speed_type="TAS")
-        print(f"{alt:8.0f} {aero.TAS:10.1f} {aero.EAS:10.1f} {aero.mach:8.4f} {aero.dynamic_pressure:10.0f}")
+    atm = isa_atmosphere(altitudes)
+    aero = aerodynamic_state(tas_fixed, atmosphere_state=atm, speed_type="TAS")
+    for alt, eas, mach, q in zip(altitudes, aero.EAS, aero.mach, aero.dynamic_pressure):
+        print(f"{alt:8.0f} {tas_fixed:10.1f} {eas:10.1f} {mach:8.4f} {q:10.0f}")
     
     # 3. Mach number calculations
     print("\n3. Mach Number Calculations:")
     print("-" * 35)
     print("Various Mach numbers at 10,000 m altitude")
     
-    mach_numbers = [0.3, 0.5, 0.7, 0.85, 0.95]
+    mach_numbers = np.array([0.3, 0.5, 0.7, 0.85, 0.95])
     cruise_altitude = 10_000  # meters
     atm_cruise = isa_atmosphere(cruise_altitude)
     
     print(f"{'Mach':>6} {'TAS [m/s]':>10} {'TAS [kt]':>10} {'q [kPa]':>10} {'p₀ [kPa]':>10}")
     print("-" * 48)
     
-    for mach in mach_numbers:
-        aero = aerodynamic_state(mach, atmosphere_state=atm_cruise, speed_type="mach")
-        tas_knots = aero.TAS * 1.944  # Convert m/s to knots
-        q_kpa = aero.dynamic_pressure / 1000
-        p0_kpa = aero.stagnation_pressure / 1000
-        print(f"{mach:6.2f} {aero.TAS:10.1f} {tas_knots:10.1f} {q_kpa:10.2f} {p0_kpa:10.2f}")
+    aero = aerodynamic_state(mach_numbers, atmosphere_state=atm_cruise, speed_type="mach")
+    tas_knots = aero.TAS * 1.944  # Convert m/s to knots
+    q_kpa = aero.dynamic_pressure / 1000
+    p0_kpa = aero.stagnation_pressure / 1000
+    for mach, tas, kt, q, p0 in zip(mach_numbers, aero.TAS, tas_knots, q_kpa, p0_kpa):
+        print(f"{mach:6.2f} {tas:10.1f} {kt:10.1f} {q:10.2f} {p0:10.2f}")
     
     # 4. Reynolds number analysis
     print("\n4. Reynolds Number Analysis:")
     print("-" * 35)
     print("Effect of characteristic length and altitude")
     
-    chord_lengths = [0.5, 1.0, 2.0, 5.0]  # meters (wing chord lengths)
-    test_altitudes = [0, 10_000]  # sea level and cruise
+    chord_lengths = np.array([0.5, 1.0, 2.0, 5.0])  # meters (wing chord lengths)
+    test_altitudes = np.array([0, 10_000])  # sea level and cruise
     test_speed = 100  # m/s TAS
     
     print(f"{'Chord [m]':>10} {'Alt [m]':>8} {'Reynolds':>12}")
     print("-" * 42)
     
-    for alt in test_altitudes:
-        atm = isa_atmosphere(alt)
-        for chord in chord_lengths:
-            aero = aerodynamic_state(test_speed, characteristic_length=chord, 
-                                   atmosphere_state=atm, speed_type="TAS")
-            print(f"{chord:10.1f} {alt:8.0f} {aero.reynolds:12.2e}")
+    # Chords as a column against altitudes as a row: one call gives a (chord, altitude) grid
+    atm = isa_atmosphere(test_altitudes)
+    aero = aerodynamic_state(test_speed, characteristic_length=chord_lengths[:, None],
+                             atmosphere_state=atm, speed_type="TAS")
+    for j, alt in enumerate(test_altitudes):
+        for i, chord in enumerate(chord_lengths):
+            print(f"{chord:10.1f} {alt:8.0f} {aero.reynolds[i, j]:12.2e}")
 
 if __name__ == "__main__":
     main()
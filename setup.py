@@ -8,6 +8,9 @@ setup(
     install_requires=[
         "numpy",
     ],
+    extras_require={
+        "numba": ["numba"],
+    },
     entry_points={
         "console_scripts": [
             "isa-toolkit=isa_toolkit.cli:main",
@@ -1,3 +1,3 @@
-from .isa import ISAState, isa_atmosphere, sea_level_atmosphere, geometric2geopotential, geopotential2geometric
+from .isa import ISAState, isa_atmosphere, isa_atmosphere_bulk, sea_level_atmosphere, geometric2geopotential, geopotential2geometric
 from .aerodynamics import AerodynamicState, aerodynamic_state
 __version__ = "0.1.0"  # Package version identifier for isa_toolkit
\ No newline at end of file
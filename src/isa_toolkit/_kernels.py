@@ -0,0 +1,50 @@
+"""Numba kernels for isa_atmosphere, imported lazily on the first array call.
+
+Importing this module requires numba; isa.py treats the ImportError as "no numba"
+and falls back to the pure-NumPy path.
+"""
+from __future__ import annotations
+import math
+from numba import njit, prange
+
+from .constants import R, gamma_air
+from .isa import _HB0, _HB1, _HB2, _TB0, _TB1, _TB2, _PB0, _PB1, _PB2, _L0, _L2, _EXP0, _EXP2, _INV_RT1
+
+# Every fast-math flag except nnan/ninf, so NaN altitudes propagate to NaN fields
+# exactly as in the scalar and NumPy paths
+_FASTMATH = {"contract", "arcp", "nsz", "reassoc", "afn"}
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _isa_point(H):
+    """All six ISA fields (T, p, rho, a, mu, nu) at a single geopotential altitude."""
+    if H < _HB1:
+        T = _TB0 + _L0 * (H - _HB0)
+        p = _PB0 * (T / _TB0) ** _EXP0
+    elif H < _HB2:
+        T = _TB1
+        p = _PB1 * math.exp(-_INV_RT1 * (H - _HB1))
+    else:
+        T = _TB2 + _L2 * (H - _HB2)
+        p = _PB2 * (T / _TB2) ** _EXP2
+    rho = p / (R * T)
+    mu = 1.458e-6 * T ** 1.5 / (T + 110.4)
+    return T, p, rho, math.sqrt(gamma_air * R * T), mu, mu / rho
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _isa_kernel(H, T, p, rho, a, mu, nu):
+    """Fused single pass over 1-D H writing all six ISA fields in place.
+
+    Single-threaded on purpose: isa_atmosphere must stay safe to call from
+    multiple Python threads.
+    """
+    for i in range(H.shape[0]):
+        T[i], p[i], rho[i], a[i], mu[i], nu[i] = _isa_point(H[i])
+
+
+@njit(cache=True, fastmath=_FASTMATH, parallel=True)
+def _isa_kernel_parallel(H, T, p, rho, a, mu, nu):
+    """Multi-threaded _isa_kernel; only used by the opt-in isa_atmosphere_bulk."""
+    for i in prange(H.shape[0]):
+        T[i], p[i], rho[i], a[i], mu[i], nu[i] = _isa_point(H[i])
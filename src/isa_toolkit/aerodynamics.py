@@ -6,7 +6,20 @@ import numpy as np
 from .constants import g0, R, gamma_air, T0, p0, R_EARTH
 from .isa import ISAState, sea_level_atmosphere, Number, ArrayLike
 
-@dataclass
+# Sea-level density and its inverse, used for the density ratio sigma = rho / rho0
+_RHO0 = sea_level_atmosphere.density
+_INV_RHO0 = 1.0 / _RHO0
+
+_SPEED_TYPES = {"TAS", "EAS", "mach"}
+
+
+def _broadcast_copy(x: np.ndarray, like: ArrayLike) -> ArrayLike:
+    """Fresh float copy of x broadcast against like; 0-d results come back as np.float64."""
+    out = np.empty(np.broadcast_shapes(np.shape(x), np.shape(like)))
+    out[...] = x
+    return out[()]
+
+@dataclass(slots=True, frozen=True)
 class AerodynamicState:
     """Aerodynamic state of aircraft returned by aerodynamic_state.
 
@@ -36,8 +49,13 @@ def aerodynamic_state(
         The type of speed provided ('TAS', 'EAS', 'mach'), by default "TAS".
     atmosphere_state : ISAState or array of ISAState, optional
         The atmospheric state(s) at the aircraft's altitude(s), by default sea_level_atmosphere.
+        For several altitudes, pass the single ISAState returned by
+        ``isa_atmosphere(altitude_array)`` (fields are already arrays) rather than a
+        list of per-altitude states, which must be unpacked in Python.
     characteristic_length : ArrayLike, optional
         Characteristic length (e.g., chord length) in meters, by default 1.
+        Broadcasts against speed and the atmosphere fields, so a column of lengths
+        with a row of altitudes yields a 2-D Reynolds number grid.
 
     Returns
     -------
@@ -49,52 +67,58 @@ def aerodynamic_state(
             reynolds : Reynolds number [-]
             dynamic_pressure : Dynamic pressure [Pa]
             stagnation_pressure : Stagnation (total) pressure [Pa]
-        For array inputs, each field is a NumPy array of matching shape.
+        For array inputs, each field is a NumPy array of matching shape. The
+        input speed field is always a new array, so mutating ``speed`` afterwards
+        does not change the returned state.
     """
 
-    allowed_speed_types = {"TAS", "EAS", "mach"}
-    if speed_type not in allowed_speed_types:
-        raise ValueError(f"Invalid speed_type '{speed_type}'. Allowed values are: {allowed_speed_types}")
+    if speed_type not in _SPEED_TYPES:
+        raise ValueError(f"Invalid speed_type '{speed_type}'. Allowed values are: {_SPEED_TYPES}")
 
     # Assign default atmosphere_state if None
     if atmosphere_state is None:
         atmosphere_state = sea_level_atmosphere
 
+    # Each atmosphere field is read exactly once into a local
     if isinstance(atmosphere_state, ISAState):
+        # Normal case: fields are scalars or arrays already laid out per altitude
         rho = atmosphere_state.density
         sos = atmosphere_state.speed_of_sound
         mu = atmosphere_state.dynamic_viscosity
         p = atmosphere_state.pressure
     else:
-        atmosphere_state = np.asarray(atmosphere_state)
+        # Slow fallback: a sequence of ISAState objects, unpacked field by field
         rho = np.array([atm.density for atm in atmosphere_state])
         sos = np.array([atm.speed_of_sound for atm in atmosphere_state])
         mu = np.array([atm.dynamic_viscosity for atm in atmosphere_state])
         p = np.array([atm.pressure for atm in atmosphere_state])
 
-    rho0 = sea_level_atmosphere.density
+    speed_arr = np.asarray(speed)
+    char_len_arr = np.asarray(characteristic_length)
 
-    speed_arr = np.array(speed)
-    char_len_arr = np.array(characteristic_length)
+    sqrt_sigma = np.sqrt(rho * _INV_RHO0)
 
+    # The field given as input is returned as a fresh copy, never the caller's array
     if speed_type == "TAS":
-        TAS = speed_arr
-        EAS = TAS * np.sqrt(rho / rho0)
+        TAS = _broadcast_copy(speed_arr, sos)
+        EAS = TAS * sqrt_sigma
+        mach = TAS / sos
     elif speed_type == "EAS":
-        EAS = speed_arr
-        TAS = EAS * np.sqrt(rho0 / rho)
-    elif speed_type == "mach":
-        mach = speed_arr
+        EAS = _broadcast_copy(speed_arr, sos)
+        TAS = EAS / sqrt_sigma
+        mach = TAS / sos
+    else:  # "mach"; speed_type was validated on entry
+        mach = _broadcast_copy(speed_arr, sos)
         TAS = mach * sos
-        EAS = TAS * np.sqrt(rho / rho0)
-    else:
-        TAS = np.array([0])
-        EAS = np.array([0])
-
-    mach = TAS / sos
-    reynolds = TAS * rho * char_len_arr / mu
-    dynamic_pressure = 0.5 * rho * TAS**2
-    stagnation_pressure = dynamic_pressure + p
+        EAS = TAS * sqrt_sigma
+
+    # Mass flux rho * TAS is shared by the Reynolds number and dynamic pressure
+    rho_TAS = rho * TAS
+    reynolds = rho_TAS * char_len_arr / mu
+    # One full-size allocation (already at the broadcast shape), then in-place update
+    dynamic_pressure = np.multiply(rho_TAS, TAS)
+    dynamic_pressure *= 0.5
+    stagnation_pressure = np.add(dynamic_pressure, p)
 
     return AerodynamicState(
         TAS=TAS,
@@ -1,4 +1,6 @@
 from __future__ import annotations
+import functools
+import math
 from dataclasses import dataclass
 from typing import Union
 import numpy as np
@@ -9,7 +11,7 @@ Number = Union[float, int]
 ArrayLike = Union[Number, np.ndarray]
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ISAState:
     """Thermodynamic state returned by isa_atmosphere.
 
@@ -44,6 +46,17 @@ _pb[1] = _pb[0] * (_Tb[1] / _Tb[0]) ** (-g0 / (R * _lapserate[0]))
 _Tb[2] = _Tb[1]  # L == 0
 _pb[2] = _pb[1] * np.exp(-g0 * (20_000.0 - 11_000.0) / (R * _Tb[1]))
 
+# Plain float copies of the layer constants so the Numba kernel can inline them
+_HB0, _HB1, _HB2 = (float(x) for x in _Hb)
+_TB0, _TB1, _TB2 = (float(x) for x in _Tb)
+_PB0, _PB1, _PB2 = (float(x) for x in _pb)
+_L0, _L2 = float(_lapserate[0]), float(_lapserate[2])
+
+# Pressure exponents of the gradient layers and the isothermal decay rate, folded at import
+_EXP0 = -g0 / (R * _L0)
+_EXP2 = -g0 / (R * _L2)
+_INV_RT1 = g0 / (R * _TB1)
+
 
 def geometric2geopotential(z: ArrayLike) -> ArrayLike:
     """Convert geometric altitude z (m above mean sea level) to geopotential altitude H (m).
@@ -51,6 +64,9 @@ def geometric2geopotential(z: ArrayLike) -> ArrayLike:
     H = R_EARTH * z / (R_EARTH + z)
     """
 
+    if type(z) in (int, float):
+        return R_EARTH * z / (R_EARTH + z)
+
     z_arr = np.asarray(z, dtype=float)
     H = R_EARTH * z_arr / (R_EARTH + z_arr)
     if np.isscalar(z):
@@ -66,6 +82,9 @@ def geopotential2geometric(H: ArrayLike) -> ArrayLike:
     z = R_EARTH * H / (R_EARTH - H)
     """
 
+    if type(H) in (int, float):
+        return R_EARTH * H / (R_EARTH - H)
+
     H_arr = np.asarray(H, dtype=float)
     z = R_EARTH * H_arr / (R_EARTH - H_arr)
     if np.isscalar(H):
@@ -74,29 +93,109 @@ def geopotential2geometric(H: ArrayLike) -> ArrayLike:
         return z
 
 
-def _isa_gradient(H: np.ndarray, Hb: float, Tb: float, pb: float, L: float):
-    """Gradient layer: Lapse rate != 0."""
-    T = Tb + L * (H - Hb)
-    p = pb * (T / Tb) ** (-g0 / (R * L))
-    return T, p
+def _isa_gradient(T: np.ndarray, Tb: float, pb: float, exponent: float):
+    """Gradient layer pressure from temperature: Lapse rate != 0, exponent = -g0 / (R * L)."""
+    # exp(k * log(x)) vectorizes better than the generic float power ufunc
+    return pb * np.exp(exponent * np.log(T / Tb))
 
 
-def _isa_isothermal(H: np.ndarray, Hb: float, Tb: float, pb: float):
-    """Isothermal layer: Lapse rate == 0."""
-    T = np.full_like(H, Tb)
-    p = pb * np.exp(-g0 * (H - Hb) / (R * Tb))
-    return T, p
+def _isa_isothermal(H: np.ndarray, Hb: float, pb: float, inv_RT: float):
+    """Isothermal layer pressure: Lapse rate == 0, inv_RT = g0 / (R * Tb)."""
+    return pb * np.exp(-inv_RT * (H - Hb))
 
 
-def _maybe_scalar(x_in: ArrayLike, x_out: np.ndarray) -> ArrayLike:
-    arr = np.asarray(x_out)
-    if np.isscalar(x_in):
-        if arr.size == 1:
-            return float(arr.item())
-        else:
-            raise ValueError("Cannot convert array of size > 1 to scalar")
+def _isa_fields_numpy(H_arr: np.ndarray):
+    """Pure-NumPy ISA evaluation of 1-D H_arr returning (T, p, rho, a, mu, nu)."""
+    T = np.empty_like(H_arr)
+    p = np.empty_like(H_arr)
+
+    # Index lists per layer, so each layer's formula runs only on its own points
+    idx0 = np.flatnonzero(H_arr < _HB1)
+    idx1 = np.flatnonzero((H_arr >= _HB1) & (H_arr < _HB2))
+    # Complement of the other two so NaN lands here and propagates instead of leaving T, p unset
+    idx2 = np.flatnonzero(~(H_arr < _HB2))
+
+    # Layer 0: 0–11 km, L = -0.0065
+    T_layer0 = _TB0 + _L0 * (H_arr[idx0] - _HB0)
+    T[idx0] = T_layer0
+    p[idx0] = _isa_gradient(T_layer0, _TB0, _PB0, _EXP0)
+
+    # Layer 1: 11–20 km, isothermal
+    T[idx1] = _TB1
+    p[idx1] = _isa_isothermal(H_arr[idx1], _HB1, _PB1, _INV_RT1)
+
+    # Layer 2: 20–32 km, L = +0.001
+    T_layer2 = _TB2 + _L2 * (H_arr[idx2] - _HB2)
+    T[idx2] = T_layer2
+    p[idx2] = _isa_gradient(T_layer2, _TB2, _PB2, _EXP2)
+
+    # Derived quantities: one new array per field, later steps applied in place
+    rho = p / T
+    rho /= R
+    a = T * (gamma_air * R)
+    np.sqrt(a, out=a)
+
+    mu = T ** 1.5 # Sutherland's formula for dynamic viscosity of air
+    mu *= 1.458e-6
+    nu = T + 110.4
+    mu /= nu
+    np.divide(mu, rho, out=nu) # Kinematic viscosity, reusing the Sutherland denominator
+
+    return T, p, rho, a, mu, nu
+
+
+@functools.lru_cache(maxsize=None)
+def _get_kernel(parallel: bool):
+    """Fused Numba kernel (multi-threaded if parallel), or None without numba.
+
+    numba and the kernels are imported on first use, so scalar-only callers such
+    as the CLI never pay for importing numba.
+    """
+    try:
+        from . import _kernels
+    except ImportError:  # numba is optional; fall back to the pure-NumPy path
+        return None
+    return _kernels._isa_kernel_parallel if parallel else _kernels._isa_kernel
+
+
+# Arrays larger than this use the multi-threaded kernel in isa_atmosphere_bulk
+_BULK_PARALLEL_THRESHOLD = 10_000
+
+
+def _isa_fields(H_arr: np.ndarray, parallel: bool = False):
+    """Return (T, p, rho, a, mu, nu) shaped like H_arr, using the Numba kernel if available."""
+    # Both paths work on a flat 1-D copy so in-place updates never hit 0-d scalars
+    H_flat = np.ascontiguousarray(H_arr, dtype=float).ravel()
+    kernel = _get_kernel(parallel)
+    if kernel is None:
+        fields = _isa_fields_numpy(H_flat)
+    else:
+        fields = tuple(np.empty_like(H_flat) for _ in range(6))
+        kernel(H_flat, *fields)
+    return tuple(x.reshape(H_arr.shape) for x in fields)
+
+
+@functools.lru_cache(maxsize=256)
+def _isa_scalar(H: float) -> tuple:
+    """Cached (T, p, rho, a, mu, nu) floats for a single geopotential altitude.
+
+    Plain Python/math arithmetic: avoids ndarray allocation and ufunc dispatch for scalars.
+    """
+    if H < _HB1:
+        T = _TB0 + _L0 * (H - _HB0)
+        p = _PB0 * math.pow(T / _TB0, _EXP0)
+    elif H < _HB2:
+        T = _TB1
+        p = _PB1 * math.exp(-_INV_RT1 * (H - _HB1))
     else:
-        return arr
+        T = _TB2 + _L2 * (H - _HB2)
+        p = _PB2 * math.pow(T / _TB2, _EXP2)
+
+    rho = p / (R * T)
+    a = math.sqrt(gamma_air * R * T)
+    mu = 1.458e-6 * T ** 1.5 / (T + 110.4)
+    nu = mu / rho
+    return T, p, rho, a, mu, nu
 
 
 def isa_atmosphere(
@@ -121,64 +220,76 @@ def isa_atmosphere(
     Notes
     -----
     Validated for 0–32 km geopotential altitude. Calling outside this range raises ValueError.
+    Scalar results are cached per altitude, so repeated scalar calls are cheap.
     """
 
+    if np.isscalar(altitude):
+        # Range-check before any conversion that could divide by zero far outside 0–32 km
+        if geometric:
+            z = float(altitude)
+            # Negative z is out of range anyway; pass it through so the check below rejects it
+            H = geometric2geopotential(z) if z >= 0.0 else z
+        else:
+            H = float(altitude)
+        if H < 0 or H > 32_000.0:
+            raise ValueError("This implementation supports 0–32 km geopotential altitude.")
+        if not geometric:
+            z = geopotential2geometric(H)
+        T, p, rho, a, mu, nu = _isa_scalar(H)
+        return ISAState(
+            geometric_altitude=z,
+            geopotential_altitude=H,
+            temperature=T,
+            pressure=p,
+            density=rho,
+            speed_of_sound=a,
+            dynamic_viscosity=mu,
+            kinematic_viscosity=nu,
+        )
+
+    return _isa_array_state(altitude, geometric=geometric, parallel=False)
+
+
+def _isa_array_state(altitude: ArrayLike, *, geometric: bool, parallel: bool) -> ISAState:
+    """Array path shared by isa_atmosphere and isa_atmosphere_bulk; every field is an ndarray."""
     H = geometric2geopotential(altitude) if geometric else np.asarray(altitude, dtype=float)
     H_arr = np.asarray(H, dtype=float)
 
     if np.any(H_arr < 0) or np.any(H_arr > 32_000.0):
         raise ValueError("This implementation supports 0–32 km geopotential altitude.")
 
-    # Determine which layer each point is in
-    layer = np.select(
-        [H_arr < 11_000.0, (H_arr >= 11_000.0) & (H_arr < 20_000.0), H_arr >= 20_000.0],
-        [0, 1, 2],
+    T, p, rho, a, mu, nu = _isa_fields(H_arr, parallel=parallel)
+
+    return ISAState(
+        geometric_altitude=np.asarray(altitude, dtype=float) if geometric else geopotential2geometric(H_arr),
+        geopotential_altitude=H_arr,
+        temperature=T,
+        pressure=p,
+        density=rho,
+        speed_of_sound=a,
+        dynamic_viscosity=mu,
+        kinematic_viscosity=nu,
     )
 
-    T = np.empty_like(H_arr)
-    p = np.empty_like(H_arr)
 
-    # Layer 0: 0–11 km, L = -0.0065
-    idx0 = layer == 0
-    if np.any(idx0):
-        T[idx0], p[idx0] = _isa_gradient(H_arr[idx0], _Hb[0], _Tb[0], _pb[0], _lapserate[0])
+def isa_atmosphere_bulk(
+    altitudes: ArrayLike,
+    *,
+    geometric: bool = True,
+) -> ISAState:
+    """Compute ISA state (1976) for a large altitude grid, multi-threaded.
 
-    # Layer 1: 11–20 km, isothermal
-    idx1 = layer == 1
-    if np.any(idx1):
-        T[idx1], p[idx1] = _isa_isothermal(H_arr[idx1], _Hb[1], _Tb[1], _pb[1])
+    Same inputs and result as :func:`isa_atmosphere`, but arrays of more than
+    10,000 points are evaluated by a multi-threaded (``parallel=True``) variant of
+    the fused Numba kernel, compiled on first use. Unlike ``isa_atmosphere``, it is
+    not safe to call concurrently from several Python threads. numba is optional;
+    without it this is equivalent to ``isa_atmosphere``.
+    """
 
-    # Layer 2: 20–32 km, L = +0.001
-    idx2 = layer == 2
-    if np.any(idx2):
-        T[idx2], p[idx2] = _isa_gradient(H_arr[idx2], _Hb[2], _Tb[2], _pb[2], _lapserate[2])
+    if np.isscalar(altitudes):
+        return isa_atmosphere(altitudes, geometric=geometric)
 
-    rho = p / (R * T)
-    a = np.sqrt(gamma_air * R * T)
-
-    mu = 1.458e-6 * T ** 1.5 / (T + 110.4) # Sutherland's formula for dynamic viscosity of air
-    nu = mu / rho # Kinematic viscosity
-
-    # Preserve scalar inputs as scalars
-    T_out = _maybe_scalar(altitude, T)
-    p_out = _maybe_scalar(altitude, p)
-    rho_out = _maybe_scalar(altitude, rho)
-    a_out = _maybe_scalar(altitude, a)
-    mu_out = _maybe_scalar(altitude, mu)
-    nu_out = _maybe_scalar(altitude, nu)
-
-    geometric_altitude_out = _maybe_scalar(altitude, np.asarray(altitude, dtype=float) if geometric else geopotential2geometric(H_arr))
-    geopotential_altitude_out = _maybe_scalar(altitude, H_arr)
-    
-    return ISAState(
-        geometric_altitude=geometric_altitude_out,
-        geopotential_altitude=geopotential_altitude_out,
-        temperature=T_out,
-        pressure=p_out,
-        density=rho_out,
-        speed_of_sound=a_out,
-        dynamic_viscosity=mu_out,
-        kinematic_viscosity=nu_out,
-    )
+    parallel = np.size(altitudes) > _BULK_PARALLEL_THRESHOLD
+    return _isa_array_state(altitudes, geometric=geometric, parallel=parallel)
 
 sea_level_atmosphere = isa_atmosphere(0)
\ No newline at end of file
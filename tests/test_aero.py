@@ -51,3 +51,33 @@ def test_mach_against_table():
     s = isa_atmosphere(0)
     state = aerodynamic_state(340.294, speed_type="TAS", atmosphere_state=s)
     assert abs(state.mach - 1.0) < 0.01
+
+def test_list_of_states_matches_vectorized_state():
+    alts = [0, 5000, 10000]
+    tas = np.array([100, 200, 300])
+    vec = aerodynamic_state(tas, atmosphere_state=isa_atmosphere(np.array(alts)))
+    lst = aerodynamic_state(tas, atmosphere_state=[isa_atmosphere(a) for a in alts])
+    assert np.allclose(vec.EAS, lst.EAS)
+    assert np.allclose(vec.reynolds, lst.reynolds)
+
+def test_reynolds_grid_broadcasts_lengths_against_altitudes():
+    atm = isa_atmosphere(np.array([0, 10000]))
+    chords = np.array([0.5, 1.0, 2.0, 5.0])
+    state = aerodynamic_state(100, characteristic_length=chords[:, None], atmosphere_state=atm)
+    assert state.reynolds.shape == (4, 2)
+    single = aerodynamic_state(100, characteristic_length=2.0, atmosphere_state=isa_atmosphere(10000))
+    assert np.isclose(state.reynolds[2, 1], single.reynolds)
+
+def test_scalar_mach_broadcasts_against_array_atmosphere():
+    atm = isa_atmosphere(np.array([0, 10000]))
+    state = aerodynamic_state(0.8, speed_type="mach", atmosphere_state=atm)
+    assert state.mach.shape == state.TAS.shape == (2,)
+    assert np.allclose(state.mach, 0.8)
+    assert isinstance(aerodynamic_state(0.8, speed_type="mach").mach, np.float64)
+
+def test_input_speed_is_copied():
+    v = np.array([100.0, 200.0])
+    state = aerodynamic_state(v)
+    assert state.TAS is not v
+    v[0] = 0.0
+    assert state.TAS[0] == 100.0
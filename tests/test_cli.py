@@ -0,0 +1,19 @@
+from __future__ import annotations
+import json
+import sys
+from isa_toolkit import cli
+
+
+def test_aero_mach_json_output(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["isa-toolkit", "aero", "0.8", "--speed-type", "mach", "--output", "json"])
+    cli.main()
+    out = json.loads(capsys.readouterr().out)
+    assert abs(out["mach"] - 0.8) < 1e-12
+    assert out["TAS_m_per_s"] > 0
+
+
+def test_aero_tas_json_output(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["isa-toolkit", "aero", "100", "--output", "json"])
+    cli.main()
+    out = json.loads(capsys.readouterr().out)
+    assert abs(out["TAS_m_per_s"] - 100.0) < 1e-12
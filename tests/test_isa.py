@@ -1,6 +1,18 @@
 from __future__ import annotations
+import dataclasses
 import numpy as np
-from isa_toolkit.isa import isa_atmosphere, T0, p0
+import pytest
+import isa_toolkit.isa as isa
+from isa_toolkit.isa import (
+    isa_atmosphere,
+    sea_level_atmosphere,
+    geometric2geopotential,
+    geopotential2geometric,
+    _isa_fields,
+    _isa_fields_numpy,
+    T0,
+    p0,
+)
 
 
 def test_sea_level_matches_standards():
@@ -38,4 +50,86 @@ def test_against_reference_table():
         s = isa_atmosphere(alt)
         assert abs(s.temperature - T_ref) < 0.2
         assert abs(s.pressure - p_ref) < 150
-        assert abs(s.density - rho_ref) < 0.01
\ No newline at end of file
+        assert abs(s.density - rho_ref) < 0.01
+
+
+def test_numba_and_numpy_paths_agree():
+    if isa._get_kernel(False) is None:
+        pytest.skip("numba is not installed")
+    H = np.linspace(0.0, 32_000.0, 101)
+    for fast, ref in zip(_isa_fields(H), _isa_fields_numpy(H)):
+        assert np.allclose(fast, ref, rtol=1e-12)
+
+
+def test_scalar_input_returns_floats():
+    s = isa_atmosphere(10_000)
+    assert isinstance(s.temperature, float)
+    assert isinstance(s.geopotential_altitude, float)
+    v = isa_atmosphere(np.array([10_000.0]))
+    assert abs(s.pressure - v.pressure[0]) < 1e-9 * s.pressure
+
+
+def test_scalar_path_matches_vectorized_in_every_layer():
+    for H in (0.0, 5_000.0, 11_000.0, 15_000.0, 20_000.0, 32_000.0):
+        s = isa_atmosphere(H, geometric=False)
+        v = isa_atmosphere(np.array([H]), geometric=False)
+        for field in ("temperature", "pressure", "density", "speed_of_sound",
+                      "dynamic_viscosity", "kinematic_viscosity"):
+            assert np.isclose(getattr(s, field), getattr(v, field)[0], rtol=1e-12)
+
+
+def test_state_is_frozen():
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        sea_level_atmosphere.density = 1.0
+
+
+def test_altitude_conversion_roundtrip():
+    for z in (0, 11_000, 20_000.0, np.float64(32_000.0)):
+        H = geometric2geopotential(z)
+        assert isinstance(H, float)
+        assert abs(geopotential2geometric(H) - z) < 1e-6
+    z = np.array([0.0, 11_000.0, 32_000.0])
+    assert np.allclose(geopotential2geometric(geometric2geopotential(z)), z)
+
+
+def test_bulk_matches_isa_atmosphere(monkeypatch):
+    z = np.linspace(0.0, 32_000.0, 257)
+    ref = isa.isa_atmosphere(z)
+    for threshold in (10_000, 0):  # single-threaded and multi-threaded kernels
+        monkeypatch.setattr(isa, "_BULK_PARALLEL_THRESHOLD", threshold)
+        bulk = isa.isa_atmosphere_bulk(z)
+        for field in ("temperature", "pressure", "density", "speed_of_sound",
+                      "dynamic_viscosity", "kinematic_viscosity"):
+            assert np.allclose(getattr(bulk, field), getattr(ref, field), rtol=1e-12)
+
+
+def test_bulk_scalar_input_returns_floats():
+    s = isa.isa_atmosphere_bulk(10_000.0)
+    assert isinstance(s.geometric_altitude, float)
+    assert isinstance(s.pressure, float)
+
+
+def test_nan_altitude_propagates_like_scalar_path():
+    s = isa_atmosphere(np.nan)
+    v = isa_atmosphere(np.array([np.nan, 5_000.0]))
+    for field in ("temperature", "pressure", "density", "speed_of_sound",
+                  "dynamic_viscosity", "kinematic_viscosity"):
+        assert np.isnan(getattr(s, field))
+        assert np.isnan(getattr(v, field)[0])
+        assert np.isfinite(getattr(v, field)[1])
+
+
+def test_nan_altitude_in_numpy_and_kernel_paths():
+    # Fill and free same-sized buffers first so unwritten outputs would show stale values
+    _isa_fields_numpy(np.array([5_000.0, 5_000.0]))
+    H = np.array([np.nan, 5_000.0])
+    for fields in (_isa_fields_numpy(H), _isa_fields(H)):
+        for x in fields:
+            assert np.isnan(x[0])
+            assert np.isfinite(x[1])
+
+
+def test_out_of_range_scalar_raises_value_error():
+    for altitude, geometric in ((6_356_766.0, False), (-6_356_766.0, True), (-1.0, True), (40_000.0, True)):
+        with pytest.raises(ValueError):
+            isa_atmosphere(altitude, geometric=geometric)